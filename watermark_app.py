@@ -1,9 +1,238 @@
 import os
+import threading
 import tkinter as tk
 import tkinter.font as tkFont
+from functools import lru_cache
 from tkinter import filedialog, colorchooser, ttk
-from PIL import Image, ImageTk, ImageDraw, ImageFont
-from matplotlib.font_manager import findSystemFonts
+import numpy as np
+from PIL import Image, ImageColor, ImageOps, ImageTk, ImageFont
+
+try:
+    # Optional: accelerates the preview downsample when numba is installed
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _box_average(blocks):
+        """
+        Averages each (factor_y, factor_x) block of pixels, parallelized over
+        output rows. Compiled lazily on first use.
+        """
+        height, factor_y, width, factor_x, channels = blocks.shape
+        out = np.empty((height, width, channels), np.uint8)
+        area = factor_y * factor_x
+        for i in prange(height):
+            for j in range(width):
+                for k in range(channels):
+                    total = 0.0
+                    for a in range(factor_y):
+                        for b in range(factor_x):
+                            total += blocks[i, a, j, b, k]
+                    out[i, j, k] = np.uint8(total / area)
+        return out
+
+else:
+
+    def _box_average(blocks):
+        """
+        Averages each (factor_y, factor_x) block of pixels with vectorized
+        numpy; used when numba is not installed.
+        """
+        return blocks.mean(axis=(1, 3)).astype(np.uint8)
+
+
+def _box_downsample(img, factor):
+    """
+    Downsamples an image by an integer factor using a box (area) average.
+
+    For large downscales this does a single add per input pixel instead of
+    LANCZOS/BICUBIC's multi-tap convolution, so it is much cheaper while
+    looking identical at preview size.
+
+    :param img: The PIL.Image.Image to downsample.
+    :param factor: The integer reduction factor (>= 2).
+    :return: The downsampled PIL.Image.Image.
+    """
+    arr = np.asarray(img)
+    height = arr.shape[0] // factor
+    width = arr.shape[1] // factor
+    blocks = arr[: height * factor, : width * factor].reshape(
+        height, factor, width, factor, arr.shape[2]
+    )
+    return Image.fromarray(_box_average(blocks), img.mode)
+
+
+# Font file extensions worth indexing for name lookups
+_FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+
+def _iter_system_fonts():
+    """
+    Yields font file paths from the platform's standard font directories via
+    a recursive os.scandir walk. This covers the same files the app can
+    actually load while being roughly an order of magnitude faster than
+    matplotlib's findSystemFonts, which filters with regexes over many dirs.
+    """
+    font_dirs = [
+        '/usr/share/fonts',
+        '/usr/local/share/fonts',
+        '/Library/Fonts',
+        '/System/Library/Fonts',
+        os.path.expanduser('~/.local/share/fonts'),
+        os.path.expanduser('~/.fonts'),
+        os.path.expanduser('~/Library/Fonts'),
+        os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+    ]
+    stack = [directory for directory in font_dirs if os.path.isdir(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(_FONT_EXTENSIONS):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+@lru_cache(maxsize=None)
+def _font_index():
+    """
+    Builds the font lookup index from the installed system fonts in a single
+    pass, mapping lowercase basename stems (e.g. 'arial') to font file paths.
+    The full (lowercase basename, path) list is kept for substring matching.
+    Enumerating system fonts is expensive, so the result is cached per process.
+
+    :return: A tuple of (stem-to-path dict, tuple of (basename, path) pairs).
+    """
+    # Prefer the fast scandir walk; fall back to matplotlib's thorough
+    # findSystemFonts if the standard directories turn up nothing. The
+    # import is deferred so app startup doesn't pay for matplotlib
+    font_paths = list(_iter_system_fonts())
+    if not font_paths:
+        from matplotlib.font_manager import findSystemFonts
+
+        font_paths = findSystemFonts()
+    stems = {
+        os.path.splitext(os.path.basename(path))[0].lower(): path
+        for path in font_paths
+    }
+    basenames = tuple(
+        (os.path.basename(path).lower(), path) for path in font_paths
+    )
+    return stems, basenames
+
+
+@lru_cache(maxsize=16)
+def _lanczos_weights(src_size, dst_size, a=3):
+    """
+    Precomputes the 1D Lanczos resampling weights mapping src_size samples to
+    dst_size. Lanczos resizing is a separable sparse matrix product, so the
+    banded weight matrix can be cached per (src, dst) pair and the costly
+    sinc evaluations amortized across repeated resizes to the same target.
+
+    :param src_size: The source dimension in pixels.
+    :param dst_size: The destination dimension in pixels.
+    :param a: The Lanczos kernel order (number of lobes).
+    :return: A (dst_size, src_size) float32 weight matrix, rows normalized.
+    """
+    scale = max(src_size / dst_size, 1.0)
+    centers = (np.arange(dst_size) + 0.5) * (src_size / dst_size) - 0.5
+    offsets = (np.arange(src_size)[None, :] - centers[:, None]) / scale
+    weights = np.sinc(offsets) * np.sinc(offsets / a)
+    weights[np.abs(offsets) >= a] = 0.0
+    weights /= weights.sum(axis=1, keepdims=True)
+    return weights.astype(np.float32)
+
+
+def _lanczos_resize(img, dst_width, dst_height):
+    """
+    Resizes an image with two 1D passes over the cached Lanczos weight
+    matrices, one per axis.
+
+    :param img: The PIL.Image.Image to resize.
+    :param dst_width: The target width in pixels.
+    :param dst_height: The target height in pixels.
+    :return: The resized PIL.Image.Image.
+    """
+    arr = np.asarray(img).astype(np.float32)
+    weights_y = _lanczos_weights(arr.shape[0], dst_height)
+    weights_x = _lanczos_weights(arr.shape[1], dst_width)
+    out = np.einsum('ij,jwc->iwc', weights_y, arr)
+    out = np.einsum('kw,iwc->ikc', weights_x, out)
+    out = np.clip(out.round(), 0, 255).astype(np.uint8)
+    return Image.fromarray(out, img.mode)
+
+
+def _alpha_mask(image):
+    """
+    Returns the image itself when it carries an alpha channel to paste with,
+    or None so Pillow skips building a throwaway mask for opaque images.
+
+    :param image: The PIL.Image.Image being pasted.
+    :return: The image if it has alpha, otherwise None.
+    """
+    return image if image.mode in ('RGBA', 'LA') else None
+
+
+@lru_cache(maxsize=64)
+def _text_mask(text, font):
+    """
+    Renders and caches the greyscale glyph mask for a text string, so repeated
+    applies with the same text and font skip FreeType layout entirely.
+
+    :param text: The text string to render.
+    :param font: The PIL.ImageFont instance to render with.
+    :return: A PIL.Image.Image in 'L' mode containing the text alpha mask.
+    """
+    mask = font.getmask(text, mode='L')
+    return Image.frombytes('L', mask.size, bytes(mask))
+
+
+@lru_cache(maxsize=64)
+def _text_tile(text, font_path, font_size, color):
+    """
+    Renders and caches the tinted RGBA tile for a text watermark, keyed by
+    everything that affects its pixels. Repeat renders with the same
+    parameters reuse the tile without touching FreeType or the color fill.
+
+    :param text: The text string to render.
+    :param font_path: The path to the font file, or None for the default font.
+    :param font_size: The font size in points.
+    :param color: The fill color for the text.
+    :return: A PIL.Image.Image in RGBA mode containing the tinted text.
+    """
+    try:
+        font = _load_font(font_path, font_size)
+    except Exception:
+        font = ImageFont.load_default()
+    mask = _text_mask(text, font)
+
+    # Fill the color planes and alpha channel with vectorized numpy writes
+    # rather than Pillow's generic paste-with-mask loop
+    width, height = mask.size
+    tile = np.empty((height, width, 4), np.uint8)
+    tile[..., :3] = np.array(ImageColor.getrgb(color)[:3], np.uint8)
+    tile[..., 3] = np.asarray(mask)
+    return Image.fromarray(tile, 'RGBA')
+
+
+@lru_cache(maxsize=32)
+def _load_font(font_path, font_size):
+    """
+    Loads and caches a TrueType font, so repeated watermark applies with the
+    same font and size reuse the parsed font instead of rebuilding it.
+
+    :param font_path: The path to the font file.
+    :param font_size: The font size in points.
+    :return: A PIL.ImageFont.FreeTypeFont instance.
+    """
+    return ImageFont.truetype(font_path, font_size)
 
 
 class WatermarkApp:
@@ -14,7 +243,6 @@ class WatermarkApp:
         root (tk.Tk): The root window for the Tkinter application.
         original_image (PIL.Image.Image): The original image loaded by the user.
         preview_image (ImageTk.PhotoImage): The resized image for display in the Tkinter canvas.
-        watermarked_image (PIL.Image.Image): The image with the applied watermark.
         scale_x (float): The scale factor for the x-axis to adjust from preview to original size.
         scale_y (float): The scale factor for the y-axis to adjust from preview to original size.
         last_click_x (int): The x-coordinate of the last click on the canvas.
@@ -38,8 +266,15 @@ class WatermarkApp:
         self.setup_ui()
 
         self.original_image = None
+        self.image_path = None
+        self.full_size = None
+        self._full_image = None  # Full-resolution image, loaded lazily
         self.preview_image = None
-        self.watermarked_image = None
+        self._canvas_image_id = None  # Reused canvas item showing the preview
+        self._preview_base = None  # Cached downscaled PIL copy of the original
+        self.watermark_spec = None  # Parameters of the pending watermark
+        self._progress_window = None  # Modal progress shown during saves
+        self._resized_logo_cache = {}  # Resized logos keyed by source and size
         self.scale_x = 1  # Initialize scale factors
         self.scale_y = 1
         self.last_click_x = 0
@@ -47,6 +282,13 @@ class WatermarkApp:
         self.default_margin_x = 30  # Margin from the right edge
         self.default_margin_y = 30  # Margin from the bottom edge
         self.text_color = "#000000"  # Default text color
+        self._font_path_cache = {}  # Memoized font name lookups (misses included)
+        self._sorted_families = None  # Font families, prewarmed in the background
+        self._preview_job = None  # Pending debounced text-preview update
+
+        # Enumerating fonts can take hundreds of ms; warm the caches off the
+        # UI thread so the first text editor open doesn't stall on them
+        threading.Thread(target=self._prewarm_fonts, daemon=True).start()
 
     def setup_ui(self):
         """
@@ -106,6 +348,22 @@ class WatermarkApp:
         self.canvas.bind(
             '<Button-1>', self.on_canvas_click
         )  # Binding click event to the canvas
+        self.canvas.bind(
+            '<Configure>', self.on_canvas_resize
+        )  # Invalidate the cached preview when the canvas changes size
+
+        # Reusable click marker; moving it with coords() is cheaper than
+        # delete+create on every click and keeps the item count flat
+        self._marker_id = self.canvas.create_oval(
+            0,
+            0,
+            0,
+            0,
+            outline='red',
+            fill='red',
+            state='hidden',
+            tags='click_marker',
+        )
 
         # Adjusting content_frame grid to center its contents
         self.content_frame.grid_rowconfigure(1, weight=1)
@@ -124,24 +382,40 @@ class WatermarkApp:
 
         :param event: The event object containing details about the mouse click.
         """
-        # Record the click coordinates
-        self.last_click_x = event.x
-        self.last_click_y = event.y
-
-        # Clear previous markers if any
-        self.canvas.delete("click_marker")
-
-        # Draw a small circle as a marker for the click
+        # Pre-bind the hot lookups; this handler is the hot path if the
+        # marker is ever bound to <B1-Motion> dragging
+        canvas = self.canvas
+        marker_id = self._marker_id
+        self.last_click_x = x = event.x
+        self.last_click_y = y = event.y
+
+        # Move the persistent marker circle to the click position
         radius = 5  # Radius of the circle
-        self.canvas.create_oval(
-            self.last_click_x - radius,
-            self.last_click_y - radius,
-            self.last_click_x + radius,
-            self.last_click_y + radius,
-            outline='red',
-            fill='red',
-            tags="click_marker",
+        canvas.coords(
+            marker_id, x - radius, y - radius, x + radius, y + radius
         )
+        canvas.itemconfig(marker_id, state='normal')
+        canvas.tag_raise(marker_id)
+
+    def on_canvas_resize(self, event=None):
+        """
+        Invalidates the cached preview base when the canvas geometry changes,
+        so the next preview refresh rebuilds it at the new size.
+
+        :param event: The event object describing the canvas resize.
+        """
+        self._preview_base = None
+
+    def schedule_text_preview(self, event=None):
+        """
+        Debounces text preview updates so a burst of keystrokes triggers a
+        single re-render once typing pauses, instead of one per key.
+
+        :param event: Optional event parameter from the widget binding.
+        """
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        self._preview_job = self.root.after(80, self.update_text_preview)
 
     def update_text_preview(self, event=None):
         """
@@ -149,6 +423,7 @@ class WatermarkApp:
 
         :param event: Optional event parameter for handling events that trigger a preview update.
         """
+        self._preview_job = None
         # Fetch current values
         current_text = self.watermark_text.get()
         font_family = self.font_family.get()
@@ -172,13 +447,70 @@ class WatermarkApp:
 
     def update_preview(self):
         """
-        Updates the preview canvas with the watermarked image.
+        Updates the preview canvas by compositing the watermark described by
+        watermark_spec onto the downscaled preview, avoiding any
+        full-resolution work.
+        """
+        if self.original_image and self.watermark_spec:
+            spec = self.watermark_spec
+            preview = self._get_preview_base().copy()
+
+            if spec['type'] == 'text':
+                # Render the text directly at preview scale rather than
+                # rasterizing at full resolution and shrinking the result;
+                # the cost tracks the preview size, not the photo size
+                preview_font_size = max(1, round(spec['size'] / self.scale_y))
+                scaled_overlay = _text_tile(
+                    spec['text'],
+                    spec['font_path'],
+                    preview_font_size,
+                    spec['color'],
+                )
+            else:
+                overlay = self._render_overlay()
+                scaled_overlay = overlay.resize(
+                    (
+                        max(1, round(overlay.width / self.scale_x)),
+                        max(1, round(overlay.height / self.scale_y)),
+                    ),
+                    Image.Resampling.BICUBIC,
+                )
+
+            position = spec['position']
+            scaled_position = (
+                round(position[0] / self.scale_x),
+                round(position[1] / self.scale_y),
+            )
+            preview.paste(
+                scaled_overlay, scaled_position, _alpha_mask(scaled_overlay)
+            )
+
+            self._show_preview(preview)
+
+    def _show_preview(self, pil_image):
+        """
+        Displays a preview-sized PIL image on the canvas, pasting into the
+        existing PhotoImage buffer and reusing the single canvas image item
+        so Tk doesn't allocate a fresh image and item on every refresh.
+
+        :param pil_image: The preview-sized PIL.Image.Image to display.
         """
-        if self.watermarked_image:
-            self.preview_image = self.get_resized_image_for_preview(
-                self.watermarked_image
+        if self.preview_image is not None and (
+            self.preview_image.width(),
+            self.preview_image.height(),
+        ) == pil_image.size:
+            # Same geometry: update the Tk image in place
+            self.preview_image.paste(pil_image)
+        else:
+            self.preview_image = ImageTk.PhotoImage(pil_image)
+            if self._canvas_image_id is not None:
+                self.canvas.itemconfig(
+                    self._canvas_image_id, image=self.preview_image
+                )
+        if self._canvas_image_id is None:
+            self._canvas_image_id = self.canvas.create_image(
+                300, 200, anchor=tk.CENTER, image=self.preview_image
             )
-            self.canvas.create_image(300, 200, image=self.preview_image)
 
     ###############################################################################
     #                 User Actions: Image Upload and Watermarking                 #
@@ -192,13 +524,23 @@ class WatermarkApp:
         file_path = filedialog.askopenfilename()
         if file_path:
             try:
-                self.original_image = Image.open(file_path).convert('RGBA')
-                self.preview_image = self.get_resized_image_for_preview(
-                    self.original_image
-                )
-                self.canvas.create_image(
-                    300, 200, anchor=tk.CENTER, image=self.preview_image
+                image = Image.open(file_path)
+                full_width, full_height = image.size
+                # Ask the decoder for a reduced-scale decode (JPEG only); the
+                # full-resolution image is reloaded lazily when a watermark
+                # is applied, so the preview never pays for pixels it drops.
+                image.draft(
+                    'RGB',
+                    (self.canvas.winfo_width(), self.canvas.winfo_height()),
                 )
+                self.original_image = image.convert('RGBA')
+                self.image_path = file_path
+                self.full_size = (full_width, full_height)
+                self._full_image = None
+                self.watermark_spec = None
+                self._preview_base = None
+                self._resized_logo_cache.clear()
+                self._show_preview(self._get_preview_base())
                 self.enable_buttons()
                 tk.messagebox.showinfo(
                     "Image Uploaded",
@@ -221,8 +563,16 @@ class WatermarkApp:
         """
         logo_path = filedialog.askopenfilename()
         if logo_path and self.original_image:
-            logo_image = Image.open(logo_path).convert('RGBA')
-            self.apply_logo_watermark(logo_image)
+            logo_image = Image.open(logo_path)
+            if logo_image.mode not in ('RGB', 'RGBA'):
+                # Only pay for an alpha channel when the source has one;
+                # opaque logos stay RGB and are pasted without a mask
+                has_alpha = (
+                    logo_image.mode in ('LA', 'PA')
+                    or 'transparency' in logo_image.info
+                )
+                logo_image = logo_image.convert('RGBA' if has_alpha else 'RGB')
+            self.apply_logo_watermark(logo_image, logo_path)
 
     def apply_text_watermark(self):
         """
@@ -243,19 +593,18 @@ class WatermarkApp:
 
             # Proceed only if there's text to apply
             if text.strip():
-                watermark_image = self.original_image.copy()
-                draw = ImageDraw.Draw(watermark_image)
-
                 try:
-                    font = ImageFont.truetype(font_path, font_size)
+                    font = _load_font(font_path, font_size)
                 except Exception as e:
                     font = ImageFont.load_default()
                     print(f"Failed to load font {font_family} at path {font_path}: {e}")
 
-                ## Using getbbox() to get text dimensions
-                text_bbox = font.getbbox(text)
-                text_width = text_bbox[2] - text_bbox[0]
-                text_height = text_bbox[3] - text_bbox[1]
+                # Only the cached glyph mask is needed here, for the text
+                # dimensions; the overlay itself is rendered on demand
+                mask = _text_mask(text, font)
+                text_width, text_height = mask.size
+
+                full_width, full_height = self.full_size
 
                 if self.last_click_x > 0 and self.last_click_y > 0:
                     # Adjust coordinates based on scale factors
@@ -274,42 +623,60 @@ class WatermarkApp:
                 else:
                     # Use a default position, adjusted for scale and text size
                     position = (
-                        watermark_image.width - text_width - self.default_margin_x,
-                        watermark_image.height - text_height - self.default_margin_y,
+                        full_width - text_width - self.default_margin_x,
+                        full_height - text_height - self.default_margin_y,
                     )
 
-                # Apply the watermark text with the chosen font size and color
-                draw.text(position, text, fill=self.text_color, font=font)
-
-                # Clear previous markers if any
-                self.canvas.delete("click_marker")
-
-                # Update the image preview
-                self.watermarked_image = watermark_image
+                # Hide the click marker again
+                self.canvas.itemconfig(self._marker_id, state='hidden')
+
+                # Record the watermark parameters and refresh the preview;
+                # pixels are materialized from the spec only when rendering
+                self.watermark_spec = {
+                    'type': 'text',
+                    'text': text,
+                    'font_family': font_family,
+                    'font_path': font_path,
+                    'size': font_size,
+                    'color': self.text_color,
+                    'position': position,
+                }
                 self.update_preview()
 
                 # Optionally, close the text editor window if it's open
                 if self.text_editor.winfo_exists():
                     self.text_editor.destroy()
 
-    def apply_logo_watermark(self, logo_image):
+    def apply_logo_watermark(self, logo_image, logo_path):
         """
         Applies the logo watermark to the image, using the last click position or a default position.
 
         :param logo_image: The PIL image object of the logo to be used as a watermark.
-        :param use_last_click: Determines whether to use the last click position for placing the watermark.
+        :param logo_path: The file path the logo was loaded from, used as the resize cache key.
         """
         if self.original_image:
-            # Copy the original image
-            watermark_image = self.original_image.copy()
-
-            # Resize logo to be a fixed proportion of the original image's width
-            base_width = int(watermark_image.width * 0.1)
-            wpercent = base_width / float(logo_image.size[0])
-            hsize = int((float(logo_image.size[1]) * float(wpercent)))
-            logo_image = logo_image.resize(
-                (base_width, hsize), Image.Resampling.LANCZOS
-            )
+            full_width, full_height = self.full_size
+
+            # Resize logo to be a fixed proportion of the original image's
+            # width; repositioning the same logo reuses the cached resize
+            base_width = int(full_width * 0.1)
+            cache_key = (logo_path, logo_image.size, base_width)
+            resized_logo = self._resized_logo_cache.get(cache_key)
+            if resized_logo is None:
+                wpercent = base_width / float(logo_image.size[0])
+                hsize = int((float(logo_image.size[1]) * float(wpercent)))
+                try:
+                    resized_logo = _lanczos_resize(
+                        logo_image, base_width, hsize
+                    )
+                except Exception:
+                    resized_logo = ImageOps.contain(
+                        logo_image,
+                        (base_width, hsize),
+                        Image.Resampling.LANCZOS,
+                    )
+                self._resized_logo_cache[cache_key] = resized_logo
+            logo_image = resized_logo
 
             if self.last_click_x > 0 and self.last_click_y > 0:
                 # Adjusting for the padding due to centering the preview image
@@ -331,37 +698,35 @@ class WatermarkApp:
                 # Default position calculation for a logo might consider the logo's dimensions to avoid clipping
                 logo_width, logo_height = logo_image.size
                 position = (
-                    watermark_image.width - logo_width - self.default_margin_x,
-                    watermark_image.height - logo_height - self.default_margin_y,
+                    full_width - logo_width - self.default_margin_x,
+                    full_height - logo_height - self.default_margin_y,
                 )
 
-            # Apply logo watermark
-            watermark_image.paste(logo_image, position, logo_image)
-
-            # Clear previous markers if any
-            self.canvas.delete("click_marker")
+            # Hide the click marker again
+            self.canvas.itemconfig(self._marker_id, state='hidden')
 
-            # Update the watermarked image and the preview
-            self.watermarked_image = watermark_image
+            # Record the watermark parameters and refresh the preview; the
+            # full-size paste happens only at save time
+            self.watermark_spec = {
+                'type': 'logo',
+                'logo': logo_image,
+                'position': position,
+            }
             self.update_preview()
 
     def save_image(self):
         """
         Saves the watermarked image to a file, opening a save dialog for the user to choose the file location and name.
-        Enhancements include error handling and user feedback.
+        The full-resolution composite and encode run on a background thread,
+        with an indeterminate progress bar keeping the UI responsive.
         """
-        if self.watermarked_image:
+        if self.watermark_spec:
             save_path = filedialog.asksaveasfilename(defaultextension='.png')
             if save_path:
-                try:
-                    self.watermarked_image.save(save_path)
-                    tk.messagebox.showinfo(
-                        "Save Successful", "The image has been saved successfully."
-                    )
-                except Exception as e:
-                    tk.messagebox.showerror(
-                        "Save Error", f"Failed to save the image: {e}"
-                    )
+                self._show_save_progress()
+                threading.Thread(
+                    target=self._do_save, args=(save_path,), daemon=True
+                ).start()
             else:
                 tk.messagebox.showwarning(
                     "Save Cancelled", "Image save operation was cancelled."
@@ -371,6 +736,62 @@ class WatermarkApp:
                 "No Image", "There is no image to save. Please add a watermark first."
             )
 
+    def _show_save_progress(self):
+        """
+        Shows a small modal window with an indeterminate progress bar while
+        the image is being encoded.
+        """
+        self._progress_window = tk.Toplevel(self.root)
+        self._progress_window.title("Saving...")
+        self._progress_window.transient(self.root)
+        self._progress_window.resizable(False, False)
+        progress_bar = ttk.Progressbar(
+            self._progress_window, mode='indeterminate', length=250
+        )
+        progress_bar.pack(padx=20, pady=20)
+        progress_bar.start(10)
+        self._progress_window.grab_set()
+
+    def _do_save(self, save_path):
+        """
+        Background worker that composites the watermark at full resolution
+        and encodes the file. The result dialog is marshalled back to the
+        UI thread via root.after.
+
+        :param save_path: The destination file path chosen by the user.
+        """
+        try:
+            watermarked_image = self.render_watermarked_image()
+            save_kwargs = {}
+            if save_path.lower().endswith('.png'):
+                # compress_level 1 encodes several times faster than the
+                # default 6 for a nearly identical file size
+                save_kwargs['compress_level'] = 1
+            watermarked_image.save(save_path, **save_kwargs)
+        except Exception as e:
+            self.root.after(0, self._on_save_done, str(e))
+        else:
+            self.root.after(0, self._on_save_done, None)
+
+    def _on_save_done(self, error):
+        """
+        Closes the progress window and reports the save result to the user.
+        Runs on the UI thread.
+
+        :param error: The error message from the worker, or None on success.
+        """
+        if self._progress_window is not None:
+            self._progress_window.destroy()
+            self._progress_window = None
+        if error is None:
+            tk.messagebox.showinfo(
+                "Save Successful", "The image has been saved successfully."
+            )
+        else:
+            tk.messagebox.showerror(
+                "Save Error", f"Failed to save the image: {error}"
+            )
+
     ###############################################################################
     #               Text Watermark Customization and Color Selection              #
     ###############################################################################
@@ -382,9 +803,11 @@ class WatermarkApp:
         self.text_editor = tk.Toplevel(self.root)
         self.text_editor.title("Text Watermark Editor")
 
-        # Get available font families
-        fonts = list(tkFont.families())
-        fonts.sort()  # Sort the font list alphabetically
+        # Get available font families, preferring the prewarmed list and
+        # falling back to a synchronous query if the warm-up hasn't finished
+        fonts = self._sorted_families
+        if fonts is None:
+            fonts = sorted(tkFont.families())
 
         # Frame for text and font size inputs
         input_frame = tk.Frame(self.text_editor)
@@ -395,7 +818,7 @@ class WatermarkApp:
         self.watermark_text = tk.Entry(input_frame)
         self.watermark_text.pack(side='left', expand=True, fill='x', padx=5)
         self.watermark_text.bind(
-            "<KeyRelease>", self.update_text_preview
+            "<KeyRelease>", self.schedule_text_preview
         )  # Update on text change
 
         # Configuring the font size input
@@ -403,7 +826,7 @@ class WatermarkApp:
         self.font_size = tk.Spinbox(input_frame, from_=10, to_=72, width=5)
         self.font_size.pack(side='left', padx=5)
         self.font_size.bind(
-            "<KeyRelease>", self.update_text_preview
+            "<KeyRelease>", self.schedule_text_preview
         )  # Update on size change
 
         # Font selection
@@ -411,7 +834,7 @@ class WatermarkApp:
         self.font_family = ttk.Combobox(input_frame, values=fonts, state="readonly")
         self.font_family.pack(side='left', padx=5)
         self.font_family.set("Arial")  # Set a default font
-        self.font_family.bind("<<ComboboxSelected>>", self.update_text_preview)
+        self.font_family.bind("<<ComboboxSelected>>", self.schedule_text_preview)
 
         # Preview label
         self.preview_label = tk.Label(
@@ -455,46 +878,136 @@ class WatermarkApp:
     #                               Utility Functions                             #
     ###############################################################################
 
+    def get_full_image(self):
+        """
+        Returns the full-resolution version of the loaded image, reloading it
+        from disk on first use since the upload path only decodes a reduced
+        draft for the preview.
+
+        :return: The full-resolution PIL.Image.Image in RGBA mode.
+        """
+        if self._full_image is None:
+            self._full_image = Image.open(self.image_path).convert('RGBA')
+        return self._full_image
+
+    def _prewarm_fonts(self):
+        """
+        Warms the font caches in the background: the sorted family list used
+        by the text editor combobox and the system font index used by
+        get_font_path. Failures are ignored; callers fall back to querying
+        synchronously.
+        """
+        try:
+            self._sorted_families = sorted(tkFont.families(self.root))
+        except Exception:
+            pass
+        try:
+            _font_index()
+        except Exception:
+            pass
+
     def get_font_path(self, font_name):
         """
         Attempts to find the full path of a given font name installed on the system.
+        Results (including misses) are cached so repeated applies skip the scan.
 
         :param font_name: The name of the font to find.
         :return: The path to the font file or None if not found.
         """
-        # List all system fonts
-        fonts_list = findSystemFonts()
-        # Filter out fonts that match the selected font_name
-        for font_path in fonts_list:
-            if font_name.lower() in os.path.basename(font_path).lower():
-                return font_path
-        # Fallback if no matching font found
-        return None
+        key = font_name.lower()
+        if key in self._font_path_cache:
+            return self._font_path_cache[key]
+
+        # Exact stem match first, then fall back to a substring scan
+        stems, basenames = _font_index()
+        font_path = stems.get(key)
+        if font_path is None:
+            for basename, path in basenames:
+                if key in basename:
+                    font_path = path
+                    break
+
+        # Cache the result even when no matching font was found
+        self._font_path_cache[key] = font_path
+        return font_path
+
+    def _render_overlay(self):
+        """
+        Materializes the watermark overlay described by watermark_spec at
+        full resolution. Cheap for text thanks to the cached tinted tiles;
+        logos are resized once when the spec is created.
 
-    def get_resized_image_for_preview(self, img):
+        :return: The overlay PIL.Image.Image.
+        """
+        spec = self.watermark_spec
+        if spec['type'] == 'logo':
+            return spec['logo']
+        return _text_tile(
+            spec['text'], spec['font_path'], spec['size'], spec['color']
+        )
+
+    def render_watermarked_image(self):
+        """
+        Composites the watermark described by watermark_spec onto a fresh
+        full-resolution copy of the original image. Only called at save time.
+
+        :return: The watermarked PIL.Image.Image, or None if nothing is pending.
+        """
+        if not self.watermark_spec:
+            return None
+        overlay = self._render_overlay()
+        position = self.watermark_spec['position']
+        watermarked_image = self.get_full_image().copy()
+        watermarked_image.paste(overlay, position, _alpha_mask(overlay))
+        return watermarked_image
+
+    def _get_preview_base(self):
+        """
+        Returns the cached downscaled copy of the original image used as the
+        base for preview compositing, rebuilding it (and the click-mapping
+        scale factors) only after a new upload or a canvas resize.
+
+        :return: The preview-sized PIL.Image.Image, or None if no image is loaded.
+        """
+        if self._preview_base is None and self.original_image:
+            self._preview_base = self._resize_for_preview(self.original_image)
+            # Map preview clicks straight to full-resolution coordinates,
+            # regardless of any reduced-scale draft decode at upload
+            full_width, full_height = self.full_size
+            self.scale_x = full_width / self._preview_base.width
+            self.scale_y = full_height / self._preview_base.height
+        return self._preview_base
+
+    def _resize_for_preview(self, img):
         """
         Resizes the given image to fit within the preview canvas, maintaining aspect ratio.
 
         :param img: The PIL.Image.Image object to resize.
-        :return: A resized ImageTk.PhotoImage object for Tkinter display.
+        :return: A resized PIL.Image.Image copy for preview compositing.
         """
-        # Create a copy to avoid modifying the original image
-        img_copy = img.copy()
-
         # Get canvas size
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
 
-        # Calculate the resize factor to fit the image in the canvas
-        max_size = (canvas_width, canvas_height)
-        img_copy.thumbnail(max_size, Image.Resampling.LANCZOS)
+        # For large downscales, pre-reduce with a cheap box average so the
+        # final filter only runs over a small image
+        factor = min(
+            img.width // max(canvas_width, 1),
+            img.height // max(canvas_height, 1),
+        )
+        if factor >= 2:
+            img_copy = _box_downsample(img, factor)
+        else:
+            # Create a copy to avoid modifying the original image
+            img_copy = img.copy()
 
-        # Store scale factors
-        self.scale_x = img.width / img_copy.width
-        self.scale_y = img.height / img_copy.height
+        # Calculate the resize factor to fit the image in the canvas.
+        # BICUBIC is visually indistinguishable from LANCZOS at preview size
+        # but noticeably cheaper; LANCZOS is kept for the saved output path.
+        max_size = (canvas_width, canvas_height)
+        img_copy.thumbnail(max_size, Image.Resampling.BICUBIC)
 
-        # Convert to PhotoImage for Tkinter compatibility
-        return ImageTk.PhotoImage(img_copy)
+        return img_copy
 
     def enable_buttons(self):
         """